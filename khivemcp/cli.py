@@ -26,8 +26,17 @@ app = typer.Typer(
 )
 
 
-async def run_khivemcp_server(config: ServiceConfig | GroupConfig) -> None:
-    """Initializes and runs the FastMCP server based on loaded configuration."""
+def build_khivemcp_server(config: ServiceConfig | GroupConfig) -> FastMCP:
+    """Creates a FastMCP server and registers the configured groups' operations.
+
+    The returned server is not started, so callers can choose the transport
+    (e.g. stdio via ``run_khivemcp_server``, or in-memory streams for tests).
+
+    Raises:
+        ValueError: If the config is not a ServiceConfig or GroupConfig, a
+            ServiceConfig repeats a group name, or a GroupConfig has no
+            ``class_path``.
+    """
 
     server_name = config.name
     server_description = getattr(config, "description", None)
@@ -46,11 +55,9 @@ async def run_khivemcp_server(config: ServiceConfig | GroupConfig) -> None:
         group_names = set()
         for key, group_config in config.groups.items():
             if group_config.name in group_names:
-                print(
-                    f"[Error] Duplicate group name '{group_config.name}' in ServiceConfig key '{key}'. Group names must be unique.",
-                    file=sys.stderr,
+                raise ValueError(
+                    f"Duplicate group name '{group_config.name}' in ServiceConfig key '{key}'. Group names must be unique."
                 )
-                sys.exit(1)
             group_names.add(group_config.name)
             groups_to_load.append((group_config.class_path, group_config))
     elif isinstance(config, GroupConfig):
@@ -59,15 +66,10 @@ async def run_khivemcp_server(config: ServiceConfig | GroupConfig) -> None:
             file=sys.stderr,
         )
         if not hasattr(config, "class_path") or not config.class_path:
-            print(
-                f"[Error] GroupConfig '{config.name}' needs 'class_path'.",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+            raise ValueError(f"GroupConfig '{config.name}' needs 'class_path'.")
         groups_to_load.append((config.class_path, config))
     else:
-        print("[Error] Invalid config type.", file=sys.stderr)
-        sys.exit(1)
+        raise ValueError("Invalid config type.")
 
     print(
         f"[Server] Found {len(groups_to_load)} group configuration(s).", file=sys.stderr
@@ -209,11 +211,24 @@ async def run_khivemcp_server(config: ServiceConfig | GroupConfig) -> None:
             file=sys.stderr,
         )
 
-    # 4. Start the FastMCP Server (using stdio transport by default)
     print(
-        f"[Server] Tool registration complete ({total_tools_registered} tools registered). Starting server via stdio...",
+        f"[Server] Tool registration complete ({total_tools_registered} tools registered).",
         file=sys.stderr,
     )
+    return mcp_server
+
+
+async def run_khivemcp_server(config: ServiceConfig | GroupConfig) -> None:
+    """Initializes and runs the FastMCP server based on loaded configuration."""
+
+    try:
+        mcp_server = build_khivemcp_server(config)
+    except ValueError as e:
+        print(f"[Error] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # 4. Start the FastMCP Server (using stdio transport by default)
+    print("[Server] Starting server via stdio...", file=sys.stderr)
     try:
         # This is a blocking call
         await mcp_server.run_stdio_async()
@@ -0,0 +1,91 @@
+"""Tests for khivemcp.cli module."""
+
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from khivemcp.cli import build_khivemcp_server
+from khivemcp.decorators import operation
+from khivemcp.types import GroupConfig, ServiceConfig, ServiceGroup
+
+
+class EchoGroup(ServiceGroup):
+    """Minimal group used to exercise server construction."""
+
+    @operation(name="echo")
+    async def echo(self, *, request: dict | None = None) -> dict:
+        """Echo the request back."""
+        return {"echo": request, "prefix": self.group_config.get("prefix")}
+
+    async def not_an_operation(self):
+        return "ignored"
+
+
+ECHO_CLASS_PATH = "tests.test_cli:EchoGroup"
+
+
+class TestBuildKhivemcpServer:
+    """Tests for build_khivemcp_server."""
+
+    def test_returns_unstarted_fastmcp(self):
+        """Should return a FastMCP server named after the config."""
+        config = GroupConfig(name="echo-group", class_path=ECHO_CLASS_PATH)
+
+        server = build_khivemcp_server(config)
+
+        assert isinstance(server, FastMCP)
+        assert server.name == "echo-group"
+
+    async def test_registers_group_operations(self, mock_connected_server_and_client):
+        """Should register only decorated methods under 'group.operation'."""
+        config = GroupConfig(
+            name="echo-group", class_path=ECHO_CLASS_PATH, config={"prefix": "p"}
+        )
+        server = build_khivemcp_server(config)
+
+        async with mock_connected_server_and_client(server._mcp_server) as client:
+            tools = await client.list_tools()
+            result = await client.call_tool(
+                "echo-group.echo", arguments={"request": {"x": 1}}
+            )
+
+        assert [tool.name for tool in tools.tools] == ["echo-group.echo"]
+        assert not result.isError
+        assert '"prefix": "p"' in result.content[0].text
+
+    async def test_service_config_registers_each_group(
+        self, mock_connected_server_and_client
+    ):
+        """Should register tools for every group in a ServiceConfig."""
+        config = ServiceConfig(
+            name="echo-service",
+            groups={
+                "a": GroupConfig(name="first", class_path=ECHO_CLASS_PATH),
+                "b": GroupConfig(name="second", class_path=ECHO_CLASS_PATH),
+            },
+        )
+        server = build_khivemcp_server(config)
+
+        async with mock_connected_server_and_client(server._mcp_server) as client:
+            tools = await client.list_tools()
+
+        assert {tool.name for tool in tools.tools} == {"first.echo", "second.echo"}
+
+    def test_duplicate_group_name_raises(self):
+        """Should raise ValueError when two groups share a name."""
+        config = ServiceConfig(
+            name="echo-service",
+            groups={
+                "a": GroupConfig(name="same", class_path=ECHO_CLASS_PATH),
+                "b": GroupConfig(name="same", class_path=ECHO_CLASS_PATH),
+            },
+        )
+
+        with pytest.raises(ValueError, match="Duplicate group name 'same'"):
+            build_khivemcp_server(config)
+
+    def test_invalid_config_type_raises(self):
+        """Should raise ValueError for anything but a service or group config."""
+        with pytest.raises(ValueError, match="Invalid config type"):
+            build_khivemcp_server(SimpleNamespace(name="not-a-config"))